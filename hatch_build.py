@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+# read by sqlamodels.mysqla.get_env before it trusts the compiled templates
+VERSION_FILE = "jinja2.version"
+
+
+class CompileTemplatesHook(BuildHookInterface):
+    """add the jinja templates precompiled to python modules to the wheel
+
+    They are compiled into a temporary directory so nothing is ever
+    written into the source tree.
+    """
+
+    def initialize(self, version: str, build_data: dict[str, Any]) -> None:
+        if version == "editable":
+            return
+        import jinja2
+
+        self.tmpdir = tempfile.mkdtemp()
+        env = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(
+                Path(self.root) / "sqlamodels" / "templates",
+            ),
+        )
+        # jinja refuses to compile a template that uses an unknown filter, so
+        # register stand-ins for the filters sqlamodels.mysqla.get_env adds
+        # (the real ones are looked up when rendering). This list must match
+        # get_env's, or the build fails because of ignore_errors=False.
+        env.filters["tolist"] = lambda v: v
+        env.compile_templates(self.tmpdir, zip=None, ignore_errors=False)
+        (Path(self.tmpdir) / VERSION_FILE).write_text(jinja2.__version__)
+        build_data["force_include"][self.tmpdir] = "sqlamodels/_templates"
+
+    def finalize(
+        self,
+        version: str,
+        build_data: dict[str, Any],
+        artifact_path: str,
+    ) -> None:
+        if getattr(self, "tmpdir", None):
+            shutil.rmtree(self.tmpdir, ignore_errors=True)
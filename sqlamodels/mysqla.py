@@ -3,17 +3,24 @@ from __future__ import annotations
 import re
 import sys
 from datetime import datetime
+from functools import cache
+from functools import lru_cache
 from keyword import iskeyword
 from pathlib import Path
 from typing import Any
+from typing import Callable
 from typing import IO
 from typing import NotRequired
 from typing import Sequence
 from typing import TypedDict
 
 import click
+import jinja2
+from jinja2 import BaseLoader
+from jinja2 import ChoiceLoader
 from jinja2 import Environment
 from jinja2 import FileSystemLoader
+from jinja2 import ModuleLoader
 from sqlalchemy import BINARY
 from sqlalchemy import BLOB
 from sqlalchemy import Boolean
@@ -44,29 +51,64 @@ from sqlalchemy.dialects.mysql import TINYTEXT
 from sqlalchemy.dialects.mysql import YEAR
 
 
+# wrap a value in double quotes
+dquote = '"{}"'.format
+
+
 def tolist(alist: list[Any]) -> str:
     """use double quotes for strings in a list, e.g. for Enum values"""
-    v = [f'"{v}"' for v in alist]
-    return f"[{', '.join(v)}]"
+    return f"[{', '.join(map(dquote, alist))}]"
+
+
+TEMPLATES = Path(__file__).parent / "templates"
+# only present in an installed wheel, written by hatch_build.py
+COMPILED_TEMPLATES = Path(__file__).parent / "_templates"
 
 
+def compiled_templates_ok() -> bool:
+    """compiled templates are only usable with the jinja2 that built them"""
+    try:
+        built_with = (COMPILED_TEMPLATES / "jinja2.version").read_text()
+    except OSError:
+        return False
+    return built_with == jinja2.__version__
+
+
+@cache
 def get_env() -> Environment:
-    env = Environment(loader=FileSystemLoader(Path(__file__).parent / "templates"))
+    """shared jinja environment: templates are compiled once per process"""
+    loader: BaseLoader = FileSystemLoader(TEMPLATES)
+    if compiled_templates_ok():
+        # precompiled templates just need importing
+        loader = ChoiceLoader([ModuleLoader(COMPILED_TEMPLATES), loader])
+    env = Environment(loader=loader, auto_reload=False)
+    # keep in step with the stub filters in hatch_build.py
     env.filters["tolist"] = tolist
     return env
 
 
+@lru_cache(maxsize=4096)
 def pascal_case(name: str) -> str:
     name = NON_WORD.sub("_", name.strip())
-    if name[0] in Number:
-        name = Number[name[0]] + name[1:]
+    c0 = name[0]
+    if "0" <= c0 <= "9":
+        name = Number[ord(c0) - 48] + name[1:]
     name = "".join(n[0].upper() + n[1:] for n in name.split("_"))
     name = name.replace(".", "_")
     if iskeyword(name):
         name = name + "_"
 
     # avoid masking SQLAlchemy types
-    if name in {
+    if name in RESERVED_NAMES:
+        name = name + "Class"
+    return name
+
+
+NON_WORD = re.compile(r"(\W)+")
+
+# names used by the generated module that a model class must not mask
+RESERVED_NAMES = frozenset(
+    {
         "String",
         "Enum",
         "Integer",
@@ -76,40 +118,45 @@ def pascal_case(name: str) -> str:
         "Date",
         "Text",
         "JSON",
+        "Boolean",
+        "Index",
         "Column",
         "Table",
+        "MetaData",
         "Base",
         "DeclarativeBase",
         "Mapped",
-    }:
-        name = name + "Class"
-    return name
-
-
-NON_WORD = re.compile(r"(\W)+")
-
-Number = {
-    "1": "one",
-    "2": "two",
-    "3": "three",
-    "4": "four",
-    "5": "five",
-    "6": "six",
-    "7": "seven",
-    "8": "eight",
-    "9": "nine",
-    "0": "zero",
-}
-
-
+    },
+)
+
+# spelled out leading digits, indexed by ord(digit) - ord("0")
+Number = (
+    "zero",
+    "one",
+    "two",
+    "three",
+    "four",
+    "five",
+    "six",
+    "seven",
+    "eight",
+    "nine",
+)
+
+
+@lru_cache(maxsize=4096)
 def column_name(name: str) -> str:
     if name.isidentifier() and not iskeyword(name):
         return name
-    cname = NON_WORD.sub("_", name.strip())
+    cname = name.strip()
+    # keywords such as "class" only need the trailing "_"
+    if not cname.isidentifier():
+        cname = NON_WORD.sub("_", cname)
     if iskeyword(cname):
         cname = cname + "_"
-    if cname[0] in Number:
-        cname = Number[cname[0]] + cname[1:]
+    c0 = cname[0]
+    if "0" <= c0 <= "9":
+        cname = Number[ord(c0) - 48] + cname[1:]
     return cname
 
 
@@ -126,19 +173,236 @@ class ColDict(TypedDict):
     max_length: NotRequired[int]
 
 
+class EnumDict(TypedDict):
+    name: str
+    type: str
+    # the Enum labels or SET values, identifies the type across tables
+    members: frozenset[str] | tuple[str, ...]
+
+
 class TableDict(TypedDict):
     model: str
     name: str
     columns: list[ColDict]
-    enums: list[tuple[str, str]]
+    enums: list[EnumDict]
     charset: str
     engine: str
-    indexes: set[Index]
+    indexes: list[Index]
     abstract: bool
     with_tablename: bool
     tableargs: bool
 
 
+class TypeContext:
+    """per-table state shared by the column type converters"""
+
+    def __init__(self, charset: str) -> None:
+        self.charset = charset
+        self.imports: set[str] = set()
+        self.mysql: set[str] = set()
+        self.pyimports: set[str] = set()
+        # label set -> (name, labels in declared order)
+        self.enums: dict[frozenset[str], tuple[str, tuple[str, ...]]] = {}
+        self.sets: dict[tuple[str, ...], str] = {}
+
+
+# a converter returns the (sqlalchemy type, python type, server_default)
+# for a column and records any imports it needs in the context
+Converter = Callable[[Any, Column, TypeContext], tuple[str, str, str | None]]
+
+
+def _integer(typ: Integer, c: Column, ctx: TypeContext) -> tuple[str, str, None]:
+    ctx.imports.add("Integer")
+    return "Integer", "int", None
+
+
+def _set(typ: Set, c: Column, ctx: TypeContext) -> tuple[str, str, None]:
+    if typ.values not in ctx.sets:
+        ctx.sets[typ.values] = "set_" + c.name
+    ctx.mysql.add("SET")
+    return ctx.sets[typ.values], "str", None
+
+
+def _enum(typ: Enum, c: Column, ctx: TypeContext) -> tuple[str, str, None]:
+    # enum labels are often shared between tables
+    labels = tuple(dict.fromkeys(map(sys.intern, typ.enums)))
+    s = frozenset(labels)
+    if s not in ctx.enums:
+        ctx.enums[s] = ("enum_" + c.name, labels)
+    ctx.imports.add("Enum")
+    return ctx.enums[s][0], "str", None
+
+
+def _text(typ: Text, c: Column, ctx: TypeContext) -> tuple[str, str, None]:
+    name = typ.__class__.__name__
+    usecharset = False
+    cset = getattr(typ, "charset", None)
+    if cset is not None:
+        if cset != ctx.charset:
+            usecharset = True
+            atyp = f'{name}(charset="{cset}")'
+        else:
+            atyp = f"{name}"
+    else:
+        if name == "TEXT" and not usecharset:
+            name = "Text"
+        atyp = f"{name}"
+    if name.startswith(("TINY", "LONG", "MEDIUM")) or name == "TEXT":
+        ctx.mysql.add(name)
+    else:
+        ctx.imports.add(name)
+    return atyp, "str", None
+
+
+def _string(typ: String, c: Column, ctx: TypeContext) -> tuple[str, str, None]:
+    name = typ.__class__.__name__
+    cset = getattr(typ, "charset", None)
+    if cset is not None and cset != ctx.charset:
+        atyp = f'{name}({typ.length}, charset="{cset}")'
+        ctx.mysql.add(name)
+    else:
+        if name == "VARCHAR":
+            name = "String"
+        atyp = f"{name}({typ.length})"
+        ctx.imports.add(name)
+    return atyp, "str", None
+
+
+def _timestamp(typ: TIMESTAMP, c: Column, ctx: TypeContext) -> tuple[str, str, str]:
+    ctx.imports.add("TIMESTAMP")
+    ctx.pyimports.add("from datetime import datetime")
+    ctx.imports.add("text")
+    server_default = 'text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP")'
+    return "TIMESTAMP", "datetime", server_default
+
+
+def _datetime(typ: DateTime, c: Column, ctx: TypeContext) -> tuple[str, str, None]:
+    # server_default = 'text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP")'
+    ctx.imports.add("DateTime")
+    ctx.pyimports.add("from datetime import datetime")
+    return "DateTime", "datetime", None
+
+
+def _decimal(typ: DECIMAL, c: Column, ctx: TypeContext) -> tuple[str, str, None]:
+    ctx.imports.add("DECIMAL")
+    return f"DECIMAL({typ.precision},{typ.scale})", "float", None
+
+
+def _double(typ: DOUBLE, c: Column, ctx: TypeContext) -> tuple[str, str, None]:
+    ctx.imports.add("DOUBLE")
+    return "DOUBLE", "float", None
+
+
+def _float(typ: Float, c: Column, ctx: TypeContext) -> tuple[str, str, None]:
+    ctx.imports.add("Float")
+    return "Float", "float", None
+
+
+def _date(typ: Date, c: Column, ctx: TypeContext) -> tuple[str, str, None]:
+    # server_default = 'text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP")'
+    ctx.pyimports.add("from datetime import date")
+    ctx.imports.add("Date")
+    return "Date", "date", None
+
+
+def _boolean(typ: Boolean, c: Column, ctx: TypeContext) -> tuple[str, str, None]:
+    ctx.imports.add("Boolean")
+    return "Boolean", "bool", None
+
+
+def _blob(typ: BLOB, c: Column, ctx: TypeContext) -> tuple[str, str, None]:
+    name = typ.__class__.__name__
+    ctx.mysql.add(name)
+    return name, "bytes", None
+
+
+def _binary(typ: BINARY, c: Column, ctx: TypeContext) -> tuple[str, str, None]:
+    name = typ.__class__.__name__
+    ctx.imports.add(name)
+    return f"{name}({typ.length})", "bytes", None
+
+
+def _json(typ: JSON, c: Column, ctx: TypeContext) -> tuple[str, str, None]:
+    name = typ.__class__.__name__
+    ctx.imports.add(name)
+    return name, "str", None
+
+
+def _year(typ: YEAR, c: Column, ctx: TypeContext) -> tuple[str, str, None]:
+    name = typ.__class__.__name__
+    ctx.imports.add(name)
+    return f"{name}(4)", "int", None
+
+
+# searched in order for column types not yet in CONVERTERS. Roughly
+# ordered by how common the type is in a schema, but subclasses must be
+# tested before their bases: Set, Enum and the Text types are all Strings,
+# TIMESTAMP is a DateTime and DOUBLE is a Float.
+CONVERTER_ORDER: list[tuple[tuple[type, ...], Converter]] = [
+    ((Integer,), _integer),
+    ((Set,), _set),
+    ((Enum,), _enum),
+    ((Text, TEXT, MEDIUMTEXT, TINYTEXT, LONGTEXT), _text),
+    ((String, CHAR), _string),
+    ((TIMESTAMP,), _timestamp),
+    ((DateTime,), _datetime),
+    ((DECIMAL,), _decimal),
+    ((DOUBLE,), _double),
+    ((Float,), _float),
+    ((Date,), _date),
+    ((Boolean,), _boolean),
+    ((BLOB, LONGBLOB, MEDIUMBLOB), _blob),
+    ((BINARY,), _binary),
+    ((JSON,), _json),
+    ((YEAR,), _year),
+]
+
+# converters for column types that have a length attribute
+SIZED_CONVERTERS = frozenset({_set, _enum, _text, _string, _blob, _binary})
+
+# exact column type class -> converter
+CONVERTERS: dict[type, Converter] = {
+    t: conv for types, conv in CONVERTER_ORDER for t in types
+}
+
+
+def find_converter(cls: type) -> Converter | None:
+    """converter for a column type class, remembering subclass matches"""
+    if cls in CONVERTERS:
+        return CONVERTERS[cls]
+    for types, conv in CONVERTER_ORDER:
+        if issubclass(cls, types):
+            CONVERTERS[cls] = conv
+            return conv
+    return None
+
+
+def index_order(i: Index) -> tuple[bool, str]:
+    # _column_flag marks an Index created by Column(index=True)
+    return (not getattr(i, "_column_flag", False), str(i.name))
+
+
+def all_subclasses(cls: type) -> set[type]:
+    ret: set[type] = set()
+    sub: type
+    for sub in cls.__subclasses__():
+        ret.add(sub)
+        ret |= all_subclasses(sub)
+    return ret
+
+
+def preload_converters() -> None:
+    """resolve the dialect subclasses (INTEGER, BIGINT, VARCHAR, ...)
+    imported so far, so the column loop only needs one dict lookup"""
+    for types, _ in CONVERTER_ORDER:
+        for base in types:
+            for sub in all_subclasses(base):
+                find_converter(sub)
+
+
+preload_converters()
+
+
 class ModelMaker:
     def __init__(
         self,
@@ -148,6 +412,8 @@ class ModelMaker:
         table_args: bool = True,
     ) -> None:
         self.env = env
+        self.body_template = env.get_template("body.py.tmplt")
+        self.imports_template = env.get_template("imports-one.py.tmplt")
         self.with_tablename = with_tablename
         self.engine = engine
         self.table_args = table_args
@@ -166,15 +432,11 @@ class ModelMaker:
         self,
         table: Table,
     ) -> tuple[TableDict, set[str], set[str], set[str]]:
-        mysql: set[str] = set()
-        imports: set[str] = set()
-        pyimports: set[str] = set()
-
         columns: list[ColDict] = []
-        enums: dict[frozenset[str], str] = {}
-        sets: dict[tuple[str, ...], str] = {}
         # indexes = insp.get_indexes(table.name) if insp else []
-        indexes = table.indexes
+        # a copy: single column indexes are removed below and the table's
+        # own set must stay intact for later calls (e.g. mkcopy)
+        indexes = set(table.indexes)
         options = table.dialect_options["mysql"]
         charset = "utf8mb4"
         engine = "InnoDB"
@@ -184,168 +446,74 @@ class ModelMaker:
         if "engine" in options:
             engine = options["engine"]
 
+        ctx = TypeContext(charset)
+        # single column indexes are folded into their mapped_column. If a
+        # column has several the first wins, preferring the one made by the
+        # column's own index=True (e.g. in a mkcopy table) then by name, so
+        # the choice doesn't depend on set iteration order.
+        single_col_idx: dict[str, Index] = {}
+        for i in sorted(indexes, key=index_order):
+            if len(i.columns) == 1:
+                single_col_idx.setdefault(i.columns.keys()[0], i)
+        table_name = table.name
         c: Column
         for c in table.columns:
+            cname = c.name
+            nullable = c.nullable
             typ = c.type
-            atyp = str(typ)
-            server_default = None
-            pytype = "str"
-
-            if isinstance(typ, DOUBLE):
-                atyp = "DOUBLE"
-                pytype = "float"
-                imports.add(atyp)
-            elif isinstance(typ, Float):
-                atyp = "Float"
-                pytype = "float"
-                imports.add(atyp)
-            elif isinstance(typ, Integer):
-                atyp = "Integer"
-                pytype = "int"
-                imports.add(atyp)
-            elif isinstance(typ, DECIMAL):
-                atyp = f"DECIMAL({typ.precision},{typ.scale})"
-                imports.add("DECIMAL")
-                pytype = "float"
-            elif isinstance(typ, TIMESTAMP):
-                atyp = "TIMESTAMP"
-                server_default = 'text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP")'
-                imports.add(atyp)
-                pytype = "datetime"
-                pyimports.add("from datetime import datetime")
-                imports.add("text")
-            elif isinstance(typ, DateTime):
-                atyp = "DateTime"
-                # server_default = 'text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP")'
-                imports.add(atyp)
-                pytype = "datetime"
-                pyimports.add("from datetime import datetime")
-            elif isinstance(typ, Date):
-                atyp = "Date"
-                pytype = "date"
-                # server_default = 'text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP")'
-                pyimports.add("from datetime import date")
-                imports.add(atyp)
-            elif isinstance(typ, Set):
-                if typ.values not in sets:
-                    sets[typ.values] = "set_" + c.name
-                atyp = sets[typ.values]
-                mysql.add("SET")
-            elif isinstance(typ, Enum):
-                s = frozenset(typ.enums)
-                if s not in enums:
-                    enums[s] = "enum_" + c.name
-                atyp = enums[s]
-                imports.add("Enum")
-            elif isinstance(typ, (Text, TEXT, MEDIUMTEXT, TINYTEXT, LONGTEXT)):
-                name = typ.__class__.__name__
-                usecharset = False
-                cset = getattr(typ, "charset", None)
-                if cset is not None:
-                    if cset != charset:
-                        usecharset = True
-                        atyp = f'{name}(charset="{cset}")'
-                    else:
-                        atyp = f"{name}"
-                else:
-                    if name == "TEXT" and not usecharset:
-                        name = "Text"
-                    atyp = f"{name}"
-                if name.startswith(("TINY", "LONG", "MEDIUM")) or name == "TEXT":
-                    mysql.add(name)
-                else:
-                    imports.add(name)
-
-            elif isinstance(typ, (String, CHAR)):
-                name = typ.__class__.__name__
-                cset = getattr(typ, "charset", None)
-                if cset is not None and cset != charset:
-                    atyp = f'{name}({typ.length}, charset="{cset}")'
-                    mysql.add(name)
-                else:
-                    if name == "VARCHAR":
-                        name = "String"
-                    atyp = f"{name}({typ.length})"
-                    imports.add(name)
-            elif isinstance(typ, (BLOB, LONGBLOB, MEDIUMBLOB)):
-                name = typ.__class__.__name__
-                atyp = name
-                pytype = "bytes"
-                mysql.add(name)
-            elif isinstance(typ, (BINARY,)):
-                name = typ.__class__.__name__
-                atyp = f"{name}({typ.length})"
-                imports.add(name)
-                pytype = "bytes"
-            elif isinstance(typ, (JSON)):
-                name = typ.__class__.__name__
-                atyp = name
-                imports.add(name)
-            elif isinstance(typ, YEAR):
-                name = typ.__class__.__name__
-                atyp = f"{name}(4)"
-                pytype = "int"
-                imports.add(name)
-            elif isinstance(typ, Boolean):
-                # name = typ.__class__.__name__
-                atyp = "Boolean"
-                pytype = "bool"
-                imports.add(atyp)
-
-            else:
-                raise RuntimeError(f'unknown field "{table.name}.{c.name}" {c.type}')
-            if c.nullable:
+            convert = find_converter(type(typ))
+            if convert is None:
+                raise RuntimeError(f'unknown field "{table_name}.{cname}" {typ}')
+            atyp, pytype, server_default = convert(typ, c, ctx)
+            if nullable:
                 pytype = pytype + " | None"
-            d = ColDict(
-                name=c.name,
-                type=atyp,
-                pytype=pytype,
-                nullable=c.nullable,
-                pk=c.primary_key,
-                server_default=server_default,
-                index=c.index,
-                unique=c.unique,
-                column_name=self.column_name(c.name, table.name),
-            )
-
-            if hasattr(c.type, "length"):
-                d["max_length"] = c.type.length  # type: ignore
+            d: ColDict = {
+                "name": cname,
+                "type": atyp,
+                "pytype": pytype,
+                "nullable": nullable,
+                "pk": c.primary_key,
+                "server_default": server_default,
+                "index": c.index,
+                "unique": c.unique,
+                "column_name": self.column_name(cname, table_name),
+            }
+
+            if convert in SIZED_CONVERTERS:
+                d["max_length"] = typ.length  # type: ignore
             columns.append(d)
-            for i in indexes:
-                if len(i.columns) == 1:
-                    if c.name in i.columns:
-                        d["index"] = True
-                        d["unique"] = i.unique
-                        indexes.remove(i)
-                        break
-
-        elist: list[tuple[str, str]] = []
-        for fs, name in enums.items():
-            args = ", ".join(f'"{v}"' for v in fs)
-            styp = f"Enum({args})"
-            elist.append((name, styp))
-        for e, name in sets.items():
-            args = ", ".join(f'"{v}"' for v in e)
-            styp = f"SET({args})"
-            elist.append((name, styp))
+            idx = single_col_idx.pop(cname, None)
+            if idx is not None:
+                d["index"] = True
+                d["unique"] = idx.unique
+                indexes.discard(idx)
+
+        elist: list[EnumDict] = []
+        for fs, (name, labels) in ctx.enums.items():
+            args = ", ".join(map(dquote, labels))
+            elist.append({"name": name, "type": f"Enum({args})", "members": fs})
+        for e, name in ctx.sets.items():
+            args = ", ".join(map(dquote, e))
+            elist.append({"name": name, "type": f"SET({args})", "members": e})
 
         if indexes:
-            imports.add("Index")
+            ctx.imports.add("Index")
 
         data = TableDict(
-            model=self.pascal_case(table.name),
-            name=table.name,
+            model=self.pascal_case(table_name),
+            name=table_name,
             columns=columns,
             enums=elist,
             charset=charset,
             engine=engine,
-            indexes=indexes,
+            # sorted: sets of Index iterate in memory address order
+            indexes=sorted(indexes, key=lambda i: str(i.name)),
             abstract=False,
             with_tablename=True,
             tableargs=self.table_args,
         )
 
-        return data, imports, mysql, pyimports
+        return data, ctx.imports, ctx.mysql, ctx.pyimports
 
     def pascal_case(self, name: str) -> str:
         ret = pascal_case(name)
@@ -368,16 +536,17 @@ class ModelMaker:
         imports = set()
         pyimports = set()
         ret: list[str] = []
-        enums_seen: set[tuple[str, str]] = set()
+        enums_seen: set[tuple[str, frozenset[str] | tuple[str, ...]]] = set()
         for table in tables:
             data, i, m, pi = self.convert_table(table)
             imports |= i
             mysql |= m
             pyimports |= pi
             e = []
-            for k in data["enums"]:
+            for enum in data["enums"]:
+                k = (enum["name"], enum["members"])
                 if k not in enums_seen:
-                    e.append(k)
+                    e.append(enum)
                 enums_seen.add(k)
             data["enums"] = e
             data["abstract"] = abstract
@@ -399,7 +568,7 @@ class ModelMaker:
         )
 
     def render_table(self, data: TableDict) -> str:
-        txt = self.env.get_template("body.py.tmplt").render(**data)
+        txt = self.body_template.render(data)
         return txt
 
     def gen_tables(
@@ -411,15 +580,16 @@ class ModelMaker:
         pyimports: set[str],
         out: IO[str] = sys.stdout,
     ) -> None:
-        print(f"# generated by tosqla on {datetime.now()}", file=out)
-        PyImports = self.env.get_template("imports-one.py.tmplt")
-        print(
-            PyImports.render(imports=imports, mysql=mysql, pyimports=pyimports),
-            file=out,
+        header = f"# generated by tosqla on {datetime.now()}"
+        # sorted so the imports come out in the same order on every run
+        txt = self.imports_template.render(
+            imports=tuple(sorted(imports)),
+            mysql=tuple(sorted(mysql)),
+            pyimports=tuple(sorted(pyimports)),
         )
-        for t in models:
-            print(file=out)
-            print(t, file=out)
+        # one write for the whole module: header, imports then each model
+        # separated by a blank line
+        out.write("\n\n".join([f"{header}\n{txt}", *models]) + "\n")
 
     def mkcopy(
         self,
@@ -475,10 +645,14 @@ def connect_mysql(host: str, tables: Sequence[str] | None = None) -> list[Table]
     meta = MetaData()
 
     try:
+        # reflect() fetches columns, indexes etc. for all the tables in
+        # batched get_multi_* queries. resolve_fks=False means tables that
+        # are only the target of a foreign key are not reflected, so only
+        # the requested (or the default schema's) tables are returned.
         if tables:
-            meta.reflect(only=tables, bind=engine)
+            meta.reflect(only=tables, bind=engine, resolve_fks=False)
         else:
-            meta.reflect(bind=engine)
+            meta.reflect(bind=engine, resolve_fks=False)
             tables = list(meta.tables.keys())
         return [meta.tables[t] for t in sorted(tables)]
 